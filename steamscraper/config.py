@@ -18,7 +18,7 @@ class ScraperConfig:
             config_file: Path to the TOML configuration file
         Raises:
             FileNotFoundError: If the configuration file does not exist
-            ValueError: If any mandatory fields are missing
+            ValueError: If any mandatory fields are missing or a setting is invalid
         """
         self._config_file = config_file
         self._config_data = self._read_config()
@@ -38,9 +38,11 @@ class ScraperConfig:
             return tomli.load(f)
 
     def _validate_config(self) -> None:
-        """Validate that all mandatory fields are present in the configuration.
+        """Validate that all mandatory fields are present in the configuration
+        and that optional settings have usable values.
         Raises:
-            ValueError: If any mandatory fields are missing
+            ValueError: If any mandatory fields are missing or parse_workers is not
+                        a non-negative integer
         """
         mandatory_fields = ["steamlogin", "password", "username", "steamid"]
         missing_fields = []
@@ -52,6 +54,10 @@ class ScraperConfig:
         if missing_fields:
             raise ValueError(f"Missing mandatory fields in configuration: {', '.join(missing_fields)}")
 
+        parse_workers = self._config_data.get("parse_workers", 0)
+        if isinstance(parse_workers, bool) or not isinstance(parse_workers, int) or parse_workers < 0:
+            raise ValueError(f"parse_workers must be a non-negative integer, got: {parse_workers!r}")
+
     @property
     def appid(self) -> str:
         """Get the Steam Workshop App ID."""
@@ -76,3 +82,8 @@ class ScraperConfig:
     def steamid(self) -> str:
         """Get the Steam ID."""
         return self._config_data["steamid"]
+
+    @property
+    def parse_workers(self) -> int:
+        """Get the number of parser processes (0 parses pages inline)."""
+        return self._config_data.get("parse_workers", 0)
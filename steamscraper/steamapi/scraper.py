@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 
 import steam.webauth as wa
-from typing import Dict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from steamscraper.config import ScraperConfig
 from steamscraper.steamapi.steamguard import get_steamguard_code
 
 
+def _parse_entries(text: str) -> List[Tuple[str, str]]:
+    """Extract workshop items from a page of HTML.
+    Kept at module level so it can be shipped to parser worker processes.
+    Args:
+        text: The raw HTML data from the Steam Workshop page
+    Returns:
+        List of (mod ID, mod name) tuples in page order (empty if no more results)
+    """
+    soup = BeautifulSoup(text, 'html.parser')
+    div_entries = soup.find_all('div', class_='itemContents')
+
+    entries = []
+    for addon_entry in div_entries:
+        addon_id = addon_entry.find('a').attrs.get('href').split('=')[1]
+        title = addon_entry.find('div', {'class': 'workshopItemTitle'}).text
+        entries.append((addon_id, title))
+
+    return entries
+
+
 class Scraper:
     """A class to scrape Steam Workshop for subscribed addons.
     Authenticates with Steam and retrieves information about subscribed workshop items."""
@@ -24,9 +45,16 @@ class Scraper:
 
         self._results: Dict[str, str] = {}
 
-    def subscription_data(self) -> Dict[str, str]:
+    def subscription_data(self, pool: Optional[Executor] = None, workers: int = 1) -> Dict[str, str]:
         """Connect to Steam URL and get the mod info scraped from the web page.
         Due to pagination, we loop until there are no more results.
+        Pages are parsed inline unless a pool is given or parse_workers is set in the
+        configuration, in which case fetching and parsing are pipelined.
+        Args:
+            pool: Optional executor to parse pages in, e.g. a process pool shared
+                  across several scrapers in a batch crawl
+            workers: Number of pages this scraper may have in flight on the given
+                     pool, typically the pool's worker count
         Returns:
             Dictionary mapping mod IDs to mod names
         """
@@ -34,8 +62,16 @@ class Scraper:
         url_steamid = f'https://steamcommunity.com/id/{self._config.steamid}/myworkshopfiles/?appid={self._config.appid}&browsefilter=mysubscriptions'
         url_username = f'https://steamcommunity.com/id/{self._config.username}/myworkshopfiles/?appid={self._config.appid}&browsefilter=mysubscriptions'
 
-        self._parse_loop(url_steamid)
-        self._parse_loop(url_username)
+        if pool is not None:
+            self._pipeline_loop(url_steamid, pool, workers=workers)
+            self._pipeline_loop(url_username, pool, workers=workers)
+        elif self._config.parse_workers > 0:
+            with ProcessPoolExecutor(max_workers=self._config.parse_workers) as own_pool:
+                self._pipeline_loop(url_steamid, own_pool, workers=self._config.parse_workers)
+                self._pipeline_loop(url_username, own_pool, workers=self._config.parse_workers)
+        else:
+            self._parse_loop(url_steamid)
+            self._parse_loop(url_username)
         return self._results
 
     def _parse_loop(self, url: str) -> int:
@@ -49,6 +85,59 @@ class Scraper:
             page += 1
         return counter
 
+    def _pipeline_loop(self, url: str, pool: Executor, workers: int = 1) -> int:
+        """Fetch pages and hand their HTML to the pool for parsing.
+        At most one page per worker is in flight, so memory stays bounded however
+        slow the parsers are. Finished pages are checked before every fetch and
+        fetching stops as soon as any page comes back empty. Results are merged
+        in page order and errors only surface for pages up to the first empty one,
+        i.e. the pages _parse_loop would have read; read-ahead past it is dropped.
+        Args:
+            url: The workshop listing URL without the page parameter
+            pool: Executor to run the parsing in
+            workers: Number of pages allowed in flight
+        Returns:
+            Number of entries found on the last page parsed (0 when exhausted)
+        """
+        depth = max(1, workers)
+        pending: Dict[int, Future] = {}
+        next_fetch = 1
+        next_merge = 1
+        # First page known to end the listing, either empty or failed to fetch
+        last_page: Optional[int] = None
+        counter = 0
+        try:
+            while True:
+                for page, future in list(pending.items()):
+                    if last_page is not None and page > last_page:
+                        pending.pop(page).cancel()
+                    elif future.done() and future.exception() is None and not future.result():
+                        last_page = page
+
+                while next_merge in pending and pending[next_merge].done():
+                    counter = self._merge_entries(pending.pop(next_merge).result())
+                    if counter == 0:
+                        return counter
+                    next_merge += 1
+
+                if last_page is None and len(pending) < depth:
+                    try:
+                        response = self._session.get(f'{url}&p={next_fetch}')
+                    except Exception as e:
+                        # Only raised if the merge reaches this page
+                        future = Future()
+                        future.set_exception(e)
+                        last_page = next_fetch
+                    else:
+                        future = pool.submit(_parse_entries, response.text)
+                    pending[next_fetch] = future
+                    next_fetch += 1
+                else:
+                    wait([pending[next_merge]])
+        finally:
+            for future in pending.values():
+                future.cancel()
+
     def _parse_data(self, *, text: str) -> int:
         """Parse the HTML data to extract workshop item information.
         Args:
@@ -56,14 +145,16 @@ class Scraper:
         Returns:
             Number of entries found (0 indicates no more results)
         """
-        soup = BeautifulSoup(text, 'html.parser')
-        div_entries = soup.find_all('div', class_='itemContents')
-        if not div_entries:
-            return 0
-
-        for addon_entry in div_entries:
-            addon_id = addon_entry.find('a').attrs.get('href').split('=')[1]
-            title = addon_entry.find('div', {'class': 'workshopItemTitle'}).text
+        return self._merge_entries(_parse_entries(text))
+
+    def _merge_entries(self, entries: List[Tuple[str, str]]) -> int:
+        """Store parsed (mod ID, mod name) tuples in the results.
+        Args:
+            entries: Tuples as returned by the page parser
+        Returns:
+            Number of entries merged
+        """
+        for addon_id, title in entries:
             self._results[addon_id] = title
 
-        return len(div_entries)
+        return len(entries)
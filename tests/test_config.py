@@ -116,3 +116,28 @@ def test_default_appid(valid_toml_content):
 
                 # Verify default appid
                 assert config.appid == ARK_SURVIVAL_EVOLVED_APPID
+
+
+def test_parse_workers(valid_toml_content):
+    """Test the parse_workers setting defaults to inline parsing and is validated."""
+    base_config = {
+        "steamlogin": "test_steamlogin",
+        "password": "test_password",
+        "username": "test_username",
+        "steamid": "test_steamid",
+    }
+
+    with patch("builtins.open", mock_open(read_data=valid_toml_content)):
+        with patch("os.path.exists", return_value=True):
+            with patch("tomli.load", return_value=base_config):
+                assert ScraperConfig(config_file="test.conf").parse_workers == 0
+
+            with patch("tomli.load", return_value={**base_config, "parse_workers": 4}):
+                assert ScraperConfig(config_file="test.conf").parse_workers == 4
+
+            for invalid in (-1, True, "4", 2.0):
+                with patch("tomli.load", return_value={**base_config, "parse_workers": invalid}):
+                    with pytest.raises(ValueError) as excinfo:
+                        ScraperConfig(config_file="test.conf")
+
+                    assert "parse_workers" in str(excinfo.value)
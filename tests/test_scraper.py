@@ -1,4 +1,6 @@
 import pytest
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 from steamscraper.steamapi.scraper import Scraper
 from steamscraper.config import ScraperConfig
@@ -14,6 +16,7 @@ def mock_config():
     config.password = "test_password"
     config.username = "test_username"
     config.steamid = "test_steamid"
+    config.parse_workers = 0
     return config
 
 
@@ -191,3 +194,229 @@ def test_parse_data_with_results(mock_config, mock_webauth, mock_steamguard, moc
 
     # Verify the results were stored correctly
     assert scraper._results == {"12345": "Test Mod 1", "67890": "Test Mod 2"}
+
+
+def test_subscription_data_pipelined(mock_config, mock_webauth, mock_steamguard):
+    """Test subscription_data parsing pages in a pool, merged in page order."""
+    mock_webauth_class, mock_user = mock_webauth
+
+    pages = {
+        "p=1": [("12345", "Test Mod 1"), ("67890", "Test Mod 2")],
+        "p=2": [("11111", "Test Mod 3")],
+    }
+
+    def fake_get(url):
+        response = MagicMock()
+        response.text = url
+        return response
+
+    def fake_parse(text):
+        return pages.get(text.rsplit("&", 1)[1], []) if mock_config.steamid in text else []
+
+    mock_user.login.return_value.get.side_effect = fake_get
+
+    scraper = Scraper(config=mock_config)
+
+    with patch('steamscraper.steamapi.scraper._parse_entries', side_effect=fake_parse):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = scraper.subscription_data(pool=pool)
+
+    assert list(result.items()) == [
+        ("12345", "Test Mod 1"),
+        ("67890", "Test Mod 2"),
+        ("11111", "Test Mod 3"),
+    ]
+
+
+def _fake_get(url):
+    response = MagicMock()
+    response.text = url
+    return response
+
+
+def _fake_parse(pages):
+    """Parser stand-in serving entries by page number, raising for exceptions."""
+    def parse(text):
+        result = pages.get(int(text.rsplit("&p=", 1)[1]), [])
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return parse
+
+
+class _InlinePool:
+    """Executor stand-in that runs each submitted call immediately."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class _DeferredPool:
+    """Executor stand-in whose calls only run when the scraper waits on them.
+    With release_all set, waiting runs every queued call instead of just the
+    waited ones.
+    """
+
+    def __init__(self, release_all=False):
+        self.release_all = release_all
+        self.queued = []
+        self.max_queued = 0
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.queued.append((future, fn, args))
+        self.max_queued = max(self.max_queued, len(self.queued))
+        return future
+
+    def wait(self, futures, **kwargs):
+        for job in list(self.queued):
+            future, fn, args = job
+            if self.release_all or future in futures:
+                self.queued.remove(job)
+                try:
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    future.set_exception(e)
+
+
+def _run_deferred(scraper, pool, pages, workers):
+    with patch('steamscraper.steamapi.scraper._parse_entries', side_effect=_fake_parse(pages)):
+        with patch('steamscraper.steamapi.scraper.wait', side_effect=pool.wait):
+            return scraper._pipeline_loop("http://test/?a=b", pool, workers=workers)
+
+
+def test_pipeline_loop_bounded(mock_config, mock_webauth, mock_steamguard):
+    """Test that no more than one page per worker is pending."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_user.login.return_value.get.side_effect = _fake_get
+
+    pages = {page: [(str(page), "Test Mod")] for page in range(1, 5)}
+    scraper = Scraper(config=mock_config)
+    pool = _DeferredPool()
+
+    counter = _run_deferred(scraper, pool, pages, workers=2)
+
+    assert counter == 0
+    assert list(scraper._results) == ["1", "2", "3", "4"]
+    assert pool.max_queued == 2
+
+
+def test_pipeline_loop_stops_at_last_page(mock_config, mock_webauth, mock_steamguard):
+    """Test that fetching stops as soon as an empty page has been parsed."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_get = mock_user.login.return_value.get
+    mock_get.side_effect = _fake_get
+
+    pages = {1: [("12345", "Test Mod 1")]}
+    scraper = Scraper(config=mock_config)
+
+    with patch('steamscraper.steamapi.scraper._parse_entries', side_effect=_fake_parse(pages)):
+        scraper._pipeline_loop("http://test/?a=b", _InlinePool(), workers=8)
+
+    # One real page plus the empty page that ends the listing
+    assert mock_get.call_count == 2
+
+    # Worst case, nothing parses before the queue fills: page 1 is waited on
+    # with 8 pages in flight, one more page is fetched, then page 2 ends it
+    mock_get.reset_mock()
+    _run_deferred(scraper, _DeferredPool(), pages, workers=8)
+
+    assert mock_get.call_count == 1 + 8
+
+
+def test_pipeline_loop_ignores_read_ahead_errors(mock_config, mock_webauth, mock_steamguard):
+    """Test that pages past the empty page cannot fail the crawl."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_get = mock_user.login.return_value.get
+    mock_get.side_effect = _fake_get
+
+    pages = {1: [("12345", "Test Mod 1")], 2: [], 3: AttributeError("no link"), 4: AttributeError("no link")}
+    scraper = Scraper(config=mock_config)
+
+    assert _run_deferred(scraper, _DeferredPool(release_all=True), pages, workers=4) == 0
+    assert scraper._results == {"12345": "Test Mod 1"}
+
+    def failing_get(url):
+        if url.endswith("&p=3"):
+            raise ConnectionError("read-ahead fetch failed")
+        return _fake_get(url)
+
+    mock_get.side_effect = failing_get
+    scraper._results = {}
+
+    assert _run_deferred(scraper, _DeferredPool(), pages, workers=4) == 0
+    assert scraper._results == {"12345": "Test Mod 1"}
+
+
+def test_pipeline_loop_cancels_on_error(mock_config, mock_webauth, mock_steamguard):
+    """Test that queued pages are cancelled when a page the merge reaches fails."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_user.login.return_value.get.side_effect = _fake_get
+
+    pages = {1: AttributeError("no link"), 2: [("12345", "Test Mod 1")]}
+    scraper = Scraper(config=mock_config)
+    pool = _DeferredPool()
+
+    with pytest.raises(AttributeError):
+        _run_deferred(scraper, pool, pages, workers=2)
+
+    assert [future.cancelled() for future, _, _ in pool.queued] == [True]
+
+
+def test_subscription_data_parse_workers_pool_size(mock_config, mock_webauth, mock_steamguard):
+    """Test that parse_workers sizes the pool used for both listing URLs."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_get = mock_user.login.return_value.get
+    mock_get.side_effect = _fake_get
+    mock_config.parse_workers = 3
+
+    scraper = Scraper(config=mock_config)
+
+    with patch('steamscraper.steamapi.scraper.ProcessPoolExecutor',
+               side_effect=lambda max_workers: ThreadPoolExecutor(max_workers=max_workers)) as mock_pool_class:
+        with patch('steamscraper.steamapi.scraper._parse_entries', return_value=[]) as mock_parse:
+            scraper.subscription_data()
+
+    mock_pool_class.assert_called_once_with(max_workers=3)
+
+    requested = [call[0][0] for call in mock_get.call_args_list]
+    assert f'https://steamcommunity.com/id/{mock_config.steamid}/myworkshopfiles/?appid={mock_config.appid}&browsefilter=mysubscriptions&p=1' in requested
+    assert f'https://steamcommunity.com/id/{mock_config.username}/myworkshopfiles/?appid={mock_config.appid}&browsefilter=mysubscriptions&p=1' in requested
+    assert mock_parse.called
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(),
+                    reason="needs fork so workers inherit the stubbed bs4")
+def test_pipeline_loop_process_pool(mock_config, mock_webauth, mock_steamguard, mock_bs4):
+    """Test parsing with the real _parse_entries in worker processes."""
+    mock_webauth_class, mock_user = mock_webauth
+    mock_user.login.return_value.get.side_effect = _fake_get
+
+    def fake_soup(text, parser):
+        soup = MagicMock()
+        entries = []
+        page = int(text.rsplit("&p=", 1)[1])
+        if page <= 2:
+            entry = MagicMock()
+            entry.find.side_effect = [
+                MagicMock(attrs={"href": f"?id={page}"}),
+                MagicMock(text=f"Test Mod {page}"),
+            ]
+            entries.append(entry)
+        soup.find_all.return_value = entries
+        return soup
+
+    mock_bs4.side_effect = fake_soup
+
+    scraper = Scraper(config=mock_config)
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork")) as pool:
+        counter = scraper._pipeline_loop("http://test/?a=b", pool, workers=2)
+
+    assert counter == 0
+    assert scraper._results == {"1": "Test Mod 1", "2": "Test Mod 2"}